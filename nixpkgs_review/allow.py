@@ -1,14 +1,7 @@
 class AllowedFeatures:
-    aliases: bool = False
-    ifd: bool = False
-    url_literals: bool = False
+    __slots__ = ("aliases", "ifd", "url_literals")
 
     def __init__(self, features: list[str]) -> None:
-        for feature in features:
-            # ruff doesn't support match statements yet
-            if feature == "aliases":
-                self.aliases = True
-            elif feature == "ifd":
-                self.ifd = True
-            elif feature == "url-literals":
-                self.url_literals = True
+        self.aliases = "aliases" in features
+        self.ifd = "ifd" in features
+        self.url_literals = "url-literals" in features
@@ -2,6 +2,7 @@ import argparse
 import re
 import sys
 from contextlib import ExitStack
+from functools import partial
 from typing import TYPE_CHECKING
 
 from nixpkgs_review.allow import AllowedFeatures
@@ -18,24 +19,38 @@ if TYPE_CHECKING:
 
     from nixpkgs_review.nix import Attr
 
+_RANGE_RE = re.compile(r"(\d+)-(\d+)")
+_PR_URL_PREFIX = "https://github.com/NixOS/nixpkgs/pull/"
+_MAX_PR_RANGE = 1000
+
 
 def parse_pr_numbers(number_args: list[str]) -> list[int]:
     prs: list[int] = []
     for arg in number_args:
-        m = re.match(r"(\d+)-(\d+)", arg)
+        if arg.isdecimal():
+            prs.append(int(arg))
+            continue
+        m = _RANGE_RE.match(arg) if "-" in arg else None
         if m:
-            prs.extend(range(int(m.group(1)), int(m.group(2))))
-        else:
-            m = re.match(r"https://github.com/NixOS/nixpkgs/pull/(\d+)/?.*", arg)
-            if m:
-                prs.append(int(m.group(1)))
-            else:
-                try:
-                    prs.append(int(arg))
-                except ValueError:
-                    warn(f"expected number or URL, got {m}")
-                    sys.exit(1)
-    return prs
+            lo, hi = int(m.group(1)), int(m.group(2))
+            if hi - lo >= _MAX_PR_RANGE:
+                warn(f"refusing PR range larger than {_MAX_PR_RANGE}: {arg}")
+                sys.exit(1)
+            prs.extend(range(lo, hi + 1))
+            continue
+        if arg.startswith(_PR_URL_PREFIX):
+            rest = arg.removeprefix(_PR_URL_PREFIX)
+            number = rest.split("/", 1)[0].split("#", 1)[0].split("?", 1)[0]
+            if number.isdecimal():
+                prs.append(int(number))
+                continue
+        try:
+            prs.append(int(arg))
+        except ValueError:
+            warn(f"expected number or URL, got {arg}")
+            sys.exit(1)
+    # overlapping ranges or repeated arguments should only be reviewed once
+    return list(dict.fromkeys(prs))
 
 
 def pr_command(args: argparse.Namespace) -> str:
@@ -81,47 +96,54 @@ def pr_command(args: argparse.Namespace) -> str:
     ] = []
 
     allow = AllowedFeatures(args.allow)
+    systems = args.systems.split(" ")
+    only_packages = set(args.package)
+    skip_packages = set(args.skip_package)
 
     builddir = None
     with (
         Buildenv(allow.aliases, args.extra_nixpkgs_config) as nixpkgs_config,
         ExitStack() as stack,
     ):
+        make_review = partial(
+            Review,
+            build_args=args.build_args,
+            no_shell=args.no_shell,
+            run=args.run,
+            remote=args.remote,
+            api_token=args.token,
+            use_github_eval=use_github_eval,
+            only_packages=only_packages,
+            package_regexes=args.package_regex,
+            skip_packages=skip_packages,
+            skip_packages_regex=args.skip_package_regex,
+            systems=systems,
+            allow=allow,
+            checkout=checkout_option,
+            sandbox=args.sandbox,
+            build_graph=args.build_graph,
+            nixpkgs_config=nixpkgs_config,
+            extra_nixpkgs_config=args.extra_nixpkgs_config,
+            num_parallel_evals=args.num_parallel_evals,
+            show_header=not args.no_headers,
+        )
         review = None
+        enter_context = stack.enter_context
         for pr in prs:
-            builddir = stack.enter_context(Builddir(f"pr-{pr}"))
+            builddir = enter_context(Builddir(f"pr-{pr}"))
             try:
-                review = Review(
-                    builddir=builddir,
-                    build_args=args.build_args,
-                    no_shell=args.no_shell,
-                    run=args.run,
-                    remote=args.remote,
-                    api_token=args.token,
-                    use_github_eval=use_github_eval,
-                    only_packages=set(args.package),
-                    package_regexes=args.package_regex,
-                    skip_packages=set(args.skip_package),
-                    skip_packages_regex=args.skip_package_regex,
-                    systems=args.systems.split(" "),
-                    allow=allow,
-                    checkout=checkout_option,
-                    sandbox=args.sandbox,
-                    build_graph=args.build_graph,
-                    nixpkgs_config=nixpkgs_config,
-                    extra_nixpkgs_config=args.extra_nixpkgs_config,
-                    num_parallel_evals=args.num_parallel_evals,
-                    show_header=not args.no_headers,
-                )
+                review = make_review(builddir=builddir)
                 contexts.append((pr, builddir.path, review.build_pr(pr)))
             except NixpkgsReviewError as e:
                 warn(f"https://github.com/NixOS/nixpkgs/pull/{pr} failed to build: {e}")
         assert review is not None
 
-        all_succeeded = all(
+        # Use a list so that a failing PR does not skip the reviews after it.
+        results = [
             review.start_review(attrs, path, pr, args.post_result, args.print_result)
             for pr, path, attrs in contexts
-        )
+        ]
+        all_succeeded = all(results)
 
         if args.no_shell:
             sys.exit(0 if all_succeeded else 1)
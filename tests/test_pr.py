@@ -9,6 +9,7 @@ from urllib.error import HTTPError
 import pytest
 
 from nixpkgs_review.cli import main
+from nixpkgs_review.cli.pr import parse_pr_numbers
 from nixpkgs_review.utils import nix_nom_tool
 
 from .conftest import Helpers
@@ -21,6 +22,14 @@ def test_default_to_nix_if_nom_not_found(mock_shutil: Mock) -> None:
     mock_shutil.assert_called_once()
 
 
+def test_parse_pr_numbers() -> None:
+    assert parse_pr_numbers(
+        ["1", "3-5", "https://github.com/NixOS/nixpkgs/pull/7/files", "4-6"]
+    ) == [1, 3, 4, 5, 7, 6]
+    with pytest.raises(SystemExit):
+        parse_pr_numbers(["1-1001"])
+
+
 @pytest.mark.skipif(not shutil.which("nom"), reason="`nom` not found in PATH")
 def test_pr_local_eval(helpers: Helpers, capfd: pytest.CaptureFixture) -> None:
     with helpers.nixpkgs() as nixpkgs: